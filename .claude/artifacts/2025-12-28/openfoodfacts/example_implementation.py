@@ -8,12 +8,52 @@ Usage:
     python example_implementation.py
 """
 
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Optional
 import json
+import logging
+import re
 import sqlite3
+import sys
+import threading
+import time
+import weakref
+import zlib
 import openfoodfacts
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON, falls back to stdlib
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional: faster compression, falls back to zlib
+    zstandard = None
+
+try:
+    import msgspec
+except ImportError:  # optional: schema-compiled FoodItem (de)serialization
+    msgspec = None
+
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+
+logger = logging.getLogger(__name__)
 
 
 # ============================================================================
@@ -21,7 +61,7 @@ import openfoodfacts
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NutritionalData:
     """Nutritional information per 100g."""
 
@@ -35,7 +75,7 @@ class NutritionalData:
     saturated_fat: Optional[float] = None  # g
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FoodItem:
     """Food item from OpenFoodFacts."""
 
@@ -52,17 +92,110 @@ class FoodItem:
     image_url: Optional[str]
     data_quality: str = "unknown"  # complete, partial, minimal
 
+    # Literal dicts instead of dataclasses.asdict(), which deep-copies every
+    # field. Key order matches field order so the cached JSON layout is stable.
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        n = self.nutrition
+        return {
+            "barcode": self.barcode,
+            "name": self.name,
+            "brand": self.brand,
+            "nutrition": {
+                "calories": n.calories,
+                "protein": n.protein,
+                "carbs": n.carbs,
+                "fat": n.fat,
+                "fiber": n.fiber,
+                "sodium": n.sodium,
+                "sugar": n.sugar,
+                "saturated_fat": n.saturated_fat,
+            },
+            "categories": self.categories,
+            "ingredients": self.ingredients,
+            "allergens": self.allergens,
+            "serving_size": self.serving_size,
+            "nutriscore_grade": self.nutriscore_grade,
+            "nova_group": self.nova_group,
+            "image_url": self.image_url,
+            "data_quality": self.data_quality,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FoodItem":
+        """Build a FoodItem from a dict produced by to_dict()."""
+        return cls(
+            barcode=data["barcode"],
+            name=data["name"],
+            brand=data["brand"],
+            nutrition=NutritionalData(**data["nutrition"]),
+            categories=data["categories"],
+            ingredients=data["ingredients"],
+            allergens=data["allergens"],
+            serving_size=data["serving_size"],
+            nutriscore_grade=data["nutriscore_grade"],
+            nova_group=data["nova_group"],
+            image_url=data["image_url"],
+            data_quality=data["data_quality"],
+        )
+
 
 # ============================================================================
 # OpenFoodFacts Service
 # ============================================================================
 
 
+# Separator for comma-separated OpenFoodFacts fields, eating surrounding spaces
+_LIST_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
 class OpenFoodFactsService:
     """Service for interacting with OpenFoodFacts API."""
 
+    # Product fields requested from the API, built once
+    _FIELDS = (
+        "code",
+        "product_name",
+        "brands",
+        "nutriments",
+        "categories",
+        "ingredients_text",
+        "allergens",
+        "serving_size",
+        "nutriscore_grade",
+        "nova_group",
+        "image_url",
+    )
+
+    # Score per field checked by _assess_data_quality, in the same order
+    _QUALITY_WEIGHTS = (3, 2, 2, 2, 1, 1, 1, 1, 1, 1)
+
     def __init__(self, user_agent: str = "NomNom/1.0 (contact@nomnom.app)"):
         self.api = openfoodfacts.API(user_agent=user_agent)
+        self._configure_http_session()
+
+    def _configure_http_session(self):
+        """Give the SDK's shared requests.Session a larger pool and retries.
+
+        Concurrent batch fetches then reuse keep-alive TCP/TLS connections
+        instead of opening a new one per request.
+        """
+        session = getattr(self.api, "session", None) or getattr(
+            getattr(openfoodfacts, "utils", None), "http_session", None
+        )
+        if session is None:
+            return
+
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
 
     def get_food_by_barcode(self, barcode: str) -> Optional[FoodItem]:
         """
@@ -75,36 +208,19 @@ class OpenFoodFactsService:
             FoodItem if found, None otherwise
         """
         try:
-            product = self.api.product.get(
-                barcode,
-                fields=[
-                    "code",
-                    "product_name",
-                    "brands",
-                    "nutriments",
-                    "categories",
-                    "ingredients_text",
-                    "allergens",
-                    "serving_size",
-                    "nutriscore_grade",
-                    "nova_group",
-                    "image_url",
-                ],
-            )
+            product = self.api.product.get(barcode, fields=self._FIELDS)
 
             if not product or "product_name" not in product:
                 return None
 
-            food_item = self._parse_product(product)
-            food_item.data_quality = self._assess_data_quality(food_item)
-            return food_item
+            return self._parse_product(product)
 
         except Exception as e:
-            print(f"❌ OpenFoodFacts API error: {e}")
+            logger.warning("❌ OpenFoodFacts API error: %s", e)
             return None
 
     def _parse_product(self, product: dict) -> FoodItem:
-        """Convert OpenFoodFacts response to FoodItem."""
+        """Convert OpenFoodFacts response to FoodItem, with its data quality."""
         nutriments = product.get("nutriments", {})
 
         nutrition = NutritionalData(
@@ -121,15 +237,13 @@ class OpenFoodFactsService:
         # Parse categories (comma-separated string)
         categories_str = product.get("categories", "")
         categories = (
-            [c.strip() for c in categories_str.split(",")]
-            if categories_str
-            else []
+            _LIST_SPLIT_RE.split(categories_str.strip()) if categories_str else []
         )
 
         # Parse allergens (comma-separated string with en: prefix)
         allergens_str = product.get("allergens", "")
         allergens = (
-            [a.replace("en:", "").strip() for a in allergens_str.split(",")]
+            [a.removeprefix("en:") for a in _LIST_SPLIT_RE.split(allergens_str.strip())]
             if allergens_str
             else []
         )
@@ -138,52 +252,57 @@ class OpenFoodFactsService:
         brands_str = product.get("brands", "")
         brand = brands_str.split(",")[0].strip() if brands_str else None
 
+        ingredients = product.get("ingredients_text")
+        serving_size = product.get("serving_size")
+
         return FoodItem(
             barcode=product.get("code", ""),
             name=product.get("product_name", "Unknown"),
             brand=brand,
             nutrition=nutrition,
             categories=categories,
-            ingredients=product.get("ingredients_text"),
+            ingredients=ingredients,
             allergens=allergens,
-            serving_size=product.get("serving_size"),
+            serving_size=serving_size,
             nutriscore_grade=product.get("nutriscore_grade"),
             nova_group=product.get("nova_group"),
             image_url=product.get("image_url"),
+            data_quality=self._assess_data_quality(
+                nutrition, brand, ingredients, serving_size
+            ),
         )
 
-    def _assess_data_quality(self, food_item: FoodItem) -> str:
+    def _assess_data_quality(
+        self,
+        nutrition: NutritionalData,
+        brand: Optional[str],
+        ingredients: Optional[str],
+        serving_size: Optional[str],
+    ) -> str:
         """
         Assess data completeness and quality.
 
+        Takes the parsed fields rather than a FoodItem, since FoodItem is
+        frozen and the grade must be known before it is constructed.
+
         Returns:
             'complete', 'partial', or 'minimal'
         """
-        score = 0
-
-        # Required fields
-        if food_item.nutrition.calories > 0:
-            score += 3
-        if food_item.nutrition.protein > 0:
-            score += 2
-        if food_item.nutrition.carbs > 0:
-            score += 2
-        if food_item.nutrition.fat > 0:
-            score += 2
-
-        # Optional but valuable fields
-        if food_item.nutrition.fiber is not None:
-            score += 1
-        if food_item.nutrition.sodium is not None:
-            score += 1
-        if food_item.nutrition.sugar is not None:
-            score += 1
-        if food_item.brand:
-            score += 1
-        if food_item.ingredients:
-            score += 1
-        if food_item.serving_size:
-            score += 1
+        flags = (
+            # Required fields
+            nutrition.calories > 0,
+            nutrition.protein > 0,
+            nutrition.carbs > 0,
+            nutrition.fat > 0,
+            # Optional but valuable fields
+            nutrition.fiber is not None,
+            nutrition.sodium is not None,
+            nutrition.sugar is not None,
+            bool(brand),
+            bool(ingredients),
+            bool(serving_size),
+        )
+        score = sum(w * f for w, f in zip(self._QUALITY_WEIGHTS, flags))
 
         if score >= 12:
             return "complete"
@@ -198,71 +317,272 @@ class OpenFoodFactsService:
 # ============================================================================
 
 
+class MemoryCache:
+    """In-process LRU of food items, checked before the SQLite cache.
+
+    Entries expire after ttl_seconds, or sooner if set() is given a shorter
+    TTL, so items are not served past the expiry they have in SQLite.
+    """
+
+    def __init__(self, maxsize: int = 2048, ttl_seconds: float = 3600):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._items: OrderedDict[str, tuple[float, FoodItem]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, barcode: str) -> Optional[FoodItem]:
+        """Get unexpired food item and mark it most recently used."""
+        with self._lock:
+            entry = self._items.get(barcode)
+            if entry is None:
+                return None
+            expires_at, food_item = entry
+            if expires_at <= time.monotonic():
+                del self._items[barcode]
+                return None
+            self._items.move_to_end(barcode)
+            return food_item
+
+    def set(self, barcode: str, food_item: FoodItem, ttl_seconds: Optional[float] = None):
+        """Store food item, evicting the least recently used if full."""
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        with self._lock:
+            self._items[barcode] = (time.monotonic() + ttl, food_item)
+            self._items.move_to_end(barcode)
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+
+# Fixed SQL text so every call hits the connection's prepared-statement cache
+_SQL_GET = "SELECT data, expires_at FROM cached_foods WHERE barcode = ? AND expires_at > ?"
+_SQL_GET_MANY = (
+    "SELECT barcode, data, expires_at FROM cached_foods "
+    "WHERE barcode IN ({placeholders}) AND expires_at > ?"
+)
+_SQL_SET = "INSERT OR REPLACE INTO cached_foods (barcode, data, expires_at) VALUES (?, ?, ?)"
+_SQL_EXPIRE = "DELETE FROM cached_foods WHERE expires_at <= ?"
+
+_SECONDS_PER_DAY = 86400
+
+# Leading bytes of every zstd frame; anything else in the cache is zlib
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _encode_food_item(food_item: FoodItem) -> bytes:
+    """Serialize a FoodItem to JSON bytes."""
+    if msgspec is not None:
+        # Same bytes as orjson.dumps(to_dict()): fields in declaration order
+        return msgspec.json.encode(food_item)
+    return _dumps(food_item.to_dict())
+
+
+def _decode_food_item(raw: bytes) -> FoodItem:
+    """Parse JSON bytes written by _encode_food_item."""
+    if msgspec is not None:
+        try:
+            # Decodes straight into the dataclasses, no intermediate dict
+            return msgspec.json.decode(raw, type=FoodItem)
+        except msgspec.ValidationError:
+            pass  # e.g. the API returned a string where a number is declared
+    return FoodItem.from_dict(_loads(raw))
+
+
+class _ThreadConnection:
+    """Owner of one thread's connection, referenced only from threading.local."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
 class FoodItemCache:
-    """Local SQLite cache for food items."""
+    """Local SQLite cache for food items.
+
+    Each thread keeps one long-lived connection so SQLite's page cache stays
+    warm across lookups instead of reopening the database on every call.
+    """
+
+    _PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-64000",  # 64 MB
+        "PRAGMA mmap_size=30000000000",
+    )
+
+    # Bump when the cached_foods layout changes
+    _SCHEMA_VERSION = 4
+
+    _AUTO_VACUUM_INCREMENTAL = 2  # value reported by PRAGMA auto_vacuum
+    _VACUUM_PAGES = 1000  # pages released per clear_expired call
 
     def __init__(self, db_path: str = "food_cache.db"):
         self.db_path = db_path
+        self._local = threading.local()
         self._init_db()
 
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        holder = getattr(self._local, "conn", None)
+        if holder is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=256,
+            )
+            for pragma in self._PRAGMAS:
+                conn.execute(pragma)
+            holder = self._local.conn = _ThreadConnection(conn)
+            # Closed when the owning thread exits (its local is released)
+            # or at interpreter exit, whichever comes first; nothing else
+            # keeps the connection or this cache alive
+            weakref.finalize(holder, conn.close)
+        return holder.conn
+
+    def _compress(self, data: bytes) -> bytes:
+        """Compress a payload with zstd, or zlib if zstandard is missing."""
+        if zstandard is None:
+            return zlib.compress(data)
+        # (De)compressor objects are not thread-safe, so keep one per thread
+        cctx = getattr(self._local, "cctx", None)
+        if cctx is None:
+            cctx = self._local.cctx = zstandard.ZstdCompressor(level=3)
+        return cctx.compress(data)
+
+    def _decode(self, blob: bytes) -> Optional[FoodItem]:
+        """Decompress and parse a payload.
+
+        Returns None for zstd rows when zstandard is not installed, so they
+        are treated as misses and rewritten.
+        """
+        if blob[:4] != _ZSTD_MAGIC:
+            return _decode_food_item(zlib.decompress(blob))
+        if zstandard is None:
+            return None
+        dctx = getattr(self._local, "dctx", None)
+        if dctx is None:
+            dctx = self._local.dctx = zstandard.ZstdDecompressor()
+        return _decode_food_item(dctx.decompress(blob))
+
     def _init_db(self):
-        """Initialize SQLite cache database."""
-        conn = sqlite3.connect(self.db_path)
+        """Initialize SQLite cache database.
+
+        The cache is disposable, so a database written with an older schema
+        is dropped and recreated rather than migrated.
+        """
+        conn = self._conn()
+
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version != self._SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS cached_foods")
+
+        # Let clear_expired hand freed pages back to the OS. Switching an
+        # existing database needs one VACUUM; afterwards this is a no-op.
+        # Runs after the drop so an outdated table isn't rewritten first,
+        # and its pages are released by the same VACUUM.
+        (auto_vacuum,) = conn.execute("PRAGMA auto_vacuum").fetchone()
+        if auto_vacuum != self._AUTO_VACUUM_INCREMENTAL:
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS cached_foods (
                 barcode TEXT PRIMARY KEY,
-                data TEXT NOT NULL,
+                data BLOB NOT NULL,  -- compressed JSON
                 cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                expires_at TIMESTAMP NOT NULL
-            )
+                expires_at INTEGER NOT NULL  -- unix seconds
+            ) WITHOUT ROWID
         """
         )
-        conn.commit()
-        conn.close()
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cached_foods_expires "
+            "ON cached_foods(expires_at)"
+        )
+        conn.execute(f"PRAGMA user_version={self._SCHEMA_VERSION}")
 
-    def get(self, barcode: str) -> Optional[dict]:
+    def get(self, barcode: str) -> Optional[FoodItem]:
         """Get cached food item if not expired."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute(
-            "SELECT data FROM cached_foods WHERE barcode = ? AND expires_at > ?",
-            (barcode, datetime.now().isoformat()),
+        entry = self.get_with_expiry(barcode)
+        return entry[0] if entry else None
+
+    def get_with_expiry(self, barcode: str) -> Optional[tuple[FoodItem, int]]:
+        """Get cached food item and its expiry (unix seconds) if not expired."""
+        cursor = self._conn().execute(
+            _SQL_GET, (barcode, int(time.time()))
         )
         row = cursor.fetchone()
-        conn.close()
 
         if row:
-            return json.loads(row[0])
+            food_item = self._decode(row[0])
+            if food_item is not None:
+                return food_item, row[1]
         return None
 
+    def get_many(self, barcodes: list[str]) -> dict[str, FoodItem]:
+        """Get all unexpired cached food items for barcodes in one query.
+
+        Returns:
+            Mapping of barcode to cached FoodItem; misses are omitted
+        """
+        return {
+            barcode: food_item
+            for barcode, (food_item, _) in self.get_many_with_expiry(barcodes).items()
+        }
+
+    def get_many_with_expiry(
+        self, barcodes: list[str]
+    ) -> dict[str, tuple[FoodItem, int]]:
+        """Like get_many, but each item comes with its expiry (unix seconds)."""
+        if not barcodes:
+            return {}
+
+        # Same-sized batches produce the same text and share a statement
+        sql = _SQL_GET_MANY.format(placeholders=",".join("?" * len(barcodes)))
+        cursor = self._conn().execute(
+            sql, (*barcodes, int(time.time()))
+        )
+        results = {}
+        for barcode, blob, expires_at in cursor:
+            food_item = self._decode(blob)
+            if food_item is not None:
+                results[barcode] = (food_item, expires_at)
+        return results
+
     def set(self, barcode: str, food_item: FoodItem, ttl_days: int = 30):
         """Cache food item with expiration."""
-        conn = sqlite3.connect(self.db_path)
-        expires_at = datetime.now() + timedelta(days=ttl_days)
+        self.set_many([(barcode, food_item, ttl_days)])
 
-        # Convert FoodItem to dict for JSON serialization
-        data = asdict(food_item)
+    def set_many(self, items: list[tuple[str, FoodItem, int]]):
+        """Cache (barcode, food_item, ttl_days) items in a single transaction."""
+        now = int(time.time())
+        rows = [
+            (
+                barcode,
+                self._compress(_encode_food_item(food_item)),
+                now + ttl_days * _SECONDS_PER_DAY,
+            )
+            for barcode, food_item, ttl_days in items
+        ]
 
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO cached_foods (barcode, data, expires_at)
-            VALUES (?, ?, ?)
-            """,
-            (barcode, json.dumps(data), expires_at.isoformat()),
-        )
-        conn.commit()
-        conn.close()
+        conn = self._conn()
+        # Autocommit connection: open the transaction explicitly so the
+        # whole batch is committed (and synced) once
+        conn.execute("BEGIN")
+        with conn:
+            conn.executemany(_SQL_SET, rows)
 
     def clear_expired(self):
-        """Remove expired cache entries."""
-        conn = sqlite3.connect(self.db_path)
-        result = conn.execute(
-            "DELETE FROM cached_foods WHERE expires_at <= ?",
-            (datetime.now().isoformat(),),
-        )
-        deleted_count = result.rowcount
-        conn.commit()
-        conn.close()
+        """Remove expired cache entries and reclaim their space."""
+        conn = self._conn()
+        deleted_count = conn.execute(_SQL_EXPIRE, (int(time.time()),)).rowcount
+        if deleted_count:
+            # execute() would step this pragma only once (one page);
+            # executescript runs it to completion
+            conn.executescript(f"PRAGMA incremental_vacuum({self._VACUUM_PAGES});")
+        conn.execute("PRAGMA optimize")
         return deleted_count
 
 
@@ -278,13 +598,17 @@ class CachedOpenFoodFactsService:
         self,
         user_agent: str = "NomNom/1.0 (contact@nomnom.app)",
         cache_path: str = "food_cache.db",
+        max_workers: int = 8,
+        memory_cache_size: int = 2048,
     ):
         self.api_service = OpenFoodFactsService(user_agent=user_agent)
+        self.memory = MemoryCache(memory_cache_size)
         self.cache = FoodItemCache(cache_path)
+        self.max_workers = max_workers
 
     def get_food_by_barcode(self, barcode: str) -> Optional[FoodItem]:
         """
-        Get food from cache or API.
+        Get food from memory, SQLite cache or API.
 
         Args:
             barcode: Product barcode
@@ -292,13 +616,19 @@ class CachedOpenFoodFactsService:
         Returns:
             FoodItem if found (from cache or API), None otherwise
         """
-        # Check cache first
-        cached_data = self.cache.get(barcode)
-        if cached_data:
-            print(f"✓ Cache hit for barcode {barcode}")
-            return self._dict_to_food_item(cached_data)
+        # Check in-process cache, then SQLite
+        food_item = self.memory.get(barcode)
+        if food_item:
+            return food_item
+
+        entry = self.cache.get_with_expiry(barcode)
+        if entry:
+            logger.info("✓ Cache hit for barcode %s", barcode)
+            food_item, expires_at = entry
+            self.memory.set(barcode, food_item, expires_at - time.time())
+            return food_item
 
-        print(f"→ Cache miss for barcode {barcode}, fetching from API...")
+        logger.info("→ Cache miss for barcode %s, fetching from API...", barcode)
 
         # Fetch from API
         food_item = self.api_service.get_food_by_barcode(barcode)
@@ -307,30 +637,67 @@ class CachedOpenFoodFactsService:
         if food_item:
             # Use shorter TTL for incomplete data
             ttl = 7 if food_item.data_quality == "minimal" else 30
+            self.memory.set(barcode, food_item, ttl * _SECONDS_PER_DAY)
             self.cache.set(barcode, food_item, ttl_days=ttl)
-            print(f"✓ Cached food item with {ttl}-day TTL")
+            logger.info("✓ Cached food item with %d-day TTL", ttl)
 
         return food_item
 
-    def _dict_to_food_item(self, data: dict) -> FoodItem:
-        """Convert cached dict back to FoodItem."""
-        nutrition_data = data["nutrition"]
-        nutrition = NutritionalData(**nutrition_data)
+    def get_foods_by_barcodes(
+        self, barcodes: list[str]
+    ) -> dict[str, Optional[FoodItem]]:
+        """
+        Get many foods at once: one SQLite query, concurrent API fetches.
 
-        return FoodItem(
-            barcode=data["barcode"],
-            name=data["name"],
-            brand=data["brand"],
-            nutrition=nutrition,
-            categories=data["categories"],
-            ingredients=data["ingredients"],
-            allergens=data["allergens"],
-            serving_size=data["serving_size"],
-            nutriscore_grade=data["nutriscore_grade"],
-            nova_group=data["nova_group"],
-            image_url=data["image_url"],
-            data_quality=data["data_quality"],
-        )
+        Args:
+            barcodes: Product barcodes (duplicates are looked up once)
+
+        Returns:
+            Mapping of each barcode to its FoodItem, or None if not found
+        """
+        unique_barcodes = list(dict.fromkeys(barcodes))
+
+        results: dict[str, Optional[FoodItem]] = {}
+        for barcode in unique_barcodes:
+            food_item = self.memory.get(barcode)
+            if food_item:
+                results[barcode] = food_item
+
+        pending = [b for b in unique_barcodes if b not in results]
+        cached = self.cache.get_many_with_expiry(pending)
+
+        misses = []
+        for barcode in pending:
+            if barcode in cached:
+                logger.info("✓ Cache hit for barcode %s", barcode)
+                food_item, expires_at = cached[barcode]
+                self.memory.set(barcode, food_item, expires_at - time.time())
+                results[barcode] = food_item
+            else:
+                misses.append(barcode)
+
+        if misses:
+            logger.info(
+                "→ Cache miss for %d barcode(s), fetching from API...", len(misses)
+            )
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(misses))
+            ) as executor:
+                fetched = executor.map(self.api_service.get_food_by_barcode, misses)
+                for barcode, food_item in zip(misses, fetched):
+                    results[barcode] = food_item
+
+            to_cache = []
+            for barcode in misses:
+                food_item = results[barcode]
+                if food_item:
+                    # Use shorter TTL for incomplete data
+                    ttl = 7 if food_item.data_quality == "minimal" else 30
+                    self.memory.set(barcode, food_item, ttl * _SECONDS_PER_DAY)
+                    to_cache.append((barcode, food_item, ttl))
+            self.cache.set_many(to_cache)
+
+        return {barcode: results[barcode] for barcode in unique_barcodes}
 
 
 # ============================================================================
@@ -338,72 +705,82 @@ class CachedOpenFoodFactsService:
 # ============================================================================
 
 
+_GRADE_EMOJI = MappingProxyType(
+    {
+        "a": "🟢",
+        "b": "🟡",
+        "c": "🟠",
+        "d": "🟠",
+        "e": "🔴",
+    }
+)
+
+_NOVA_DESC = MappingProxyType(
+    {
+        1: "Unprocessed or minimally processed",
+        2: "Processed culinary ingredients",
+        3: "Processed foods",
+        4: "Ultra-processed foods",
+    }
+)
+
+_QUALITY_EMOJI = MappingProxyType(
+    {
+        "complete": "✅",
+        "partial": "⚠️",
+        "minimal": "❌",
+    }
+)
+
+
 def display_food_item(food_item: FoodItem):
     """Pretty print food item details."""
-    print("\n" + "=" * 70)
-    print(f"🍔 {food_item.name}")
+    # Collect lines and write them once instead of one print() per line
+    nutrition = food_item.nutrition
+    lines = ["\n" + "=" * 70, f"🍔 {food_item.name}"]
     if food_item.brand:
-        print(f"   Brand: {food_item.brand}")
-    print("=" * 70)
-
-    print(f"\n📊 Nutritional Information (per 100g):")
-    print(f"   Calories:       {food_item.nutrition.calories:.1f} kcal")
-    print(f"   Protein:        {food_item.nutrition.protein:.1f} g")
-    print(f"   Carbohydrates:  {food_item.nutrition.carbs:.1f} g")
-    if food_item.nutrition.sugar is not None:
-        print(f"     - Sugars:     {food_item.nutrition.sugar:.1f} g")
-    print(f"   Fat:            {food_item.nutrition.fat:.1f} g")
-    if food_item.nutrition.saturated_fat is not None:
-        print(f"     - Saturated:  {food_item.nutrition.saturated_fat:.1f} g")
-    if food_item.nutrition.fiber is not None:
-        print(f"   Fiber:          {food_item.nutrition.fiber:.1f} g")
-    if food_item.nutrition.sodium is not None:
-        print(f"   Sodium:         {food_item.nutrition.sodium * 1000:.1f} mg")
+        lines.append(f"   Brand: {food_item.brand}")
+    lines.append("=" * 70)
+
+    lines.append("\n📊 Nutritional Information (per 100g):")
+    lines.append(f"   Calories:       {nutrition.calories:.1f} kcal")
+    lines.append(f"   Protein:        {nutrition.protein:.1f} g")
+    lines.append(f"   Carbohydrates:  {nutrition.carbs:.1f} g")
+    if nutrition.sugar is not None:
+        lines.append(f"     - Sugars:     {nutrition.sugar:.1f} g")
+    lines.append(f"   Fat:            {nutrition.fat:.1f} g")
+    if nutrition.saturated_fat is not None:
+        lines.append(f"     - Saturated:  {nutrition.saturated_fat:.1f} g")
+    if nutrition.fiber is not None:
+        lines.append(f"   Fiber:          {nutrition.fiber:.1f} g")
+    if nutrition.sodium is not None:
+        lines.append(f"   Sodium:         {nutrition.sodium * 1000:.1f} mg")
 
     if food_item.serving_size:
-        print(f"\n📏 Serving Size: {food_item.serving_size}")
+        lines.append(f"\n📏 Serving Size: {food_item.serving_size}")
 
     if food_item.allergens:
-        print(f"\n⚠️  Allergens: {', '.join(food_item.allergens)}")
+        lines.append(f"\n⚠️  Allergens: {', '.join(food_item.allergens)}")
 
     if food_item.nutriscore_grade:
-        grade_emoji = {
-            "a": "🟢",
-            "b": "🟡",
-            "c": "🟠",
-            "d": "🟠",
-            "e": "🔴",
-        }
-        emoji = grade_emoji.get(food_item.nutriscore_grade, "⚪")
-        print(
+        emoji = _GRADE_EMOJI.get(food_item.nutriscore_grade, "⚪")
+        lines.append(
             f"\n{emoji} Nutri-Score: {food_item.nutriscore_grade.upper()} (a=best, e=worst)"
         )
 
     if food_item.nova_group:
-        nova_desc = {
-            1: "Unprocessed or minimally processed",
-            2: "Processed culinary ingredients",
-            3: "Processed foods",
-            4: "Ultra-processed foods",
-        }
-        print(
-            f"🏭 NOVA Group: {food_item.nova_group} ({nova_desc.get(food_item.nova_group, 'Unknown')})"
+        lines.append(
+            f"🏭 NOVA Group: {food_item.nova_group} ({_NOVA_DESC.get(food_item.nova_group, 'Unknown')})"
         )
 
-    quality_emoji = {
-        "complete": "✅",
-        "partial": "⚠️",
-        "minimal": "❌",
-    }
-    emoji = quality_emoji.get(food_item.data_quality, "❓")
-    print(
-        f"\n{emoji} Data Quality: {food_item.data_quality.upper()}"
-    )
+    emoji = _QUALITY_EMOJI.get(food_item.data_quality, "❓")
+    lines.append(f"\n{emoji} Data Quality: {food_item.data_quality.upper()}")
 
     if food_item.categories:
-        print(f"\n🏷️  Categories: {', '.join(food_item.categories[:3])}")
+        lines.append(f"\n🏷️  Categories: {', '.join(food_item.categories[:3])}")
 
-    print("=" * 70 + "\n")
+    lines.append("=" * 70 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ============================================================================
@@ -413,6 +790,9 @@ def display_food_item(food_item: FoodItem):
 
 def main():
     """Demo the OpenFoodFacts integration."""
+    # Show service cache/API messages inline with the demo output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     print("🍽️  NomNom - OpenFoodFacts Integration Demo\n")
 
     # Initialize service with caching
@@ -426,11 +806,14 @@ def main():
         ("invalid_barcode", "Invalid Barcode Test"),
     ]
 
+    # Look up all barcodes in one batch
+    food_items = service.get_foods_by_barcodes([b for b, _ in test_barcodes])
+
     for barcode, description in test_barcodes:
         print(f"\n🔍 Looking up: {description} (barcode: {barcode})")
         print("-" * 70)
 
-        food_item = service.get_food_by_barcode(barcode)
+        food_item = food_items[barcode]
 
         if food_item:
             display_food_item(food_item)
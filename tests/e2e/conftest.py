@@ -0,0 +1,26 @@
+"""Shared pytest fixtures for E2E tests."""
+
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fixtures.helpers import playwright_close, playwright_navigate
+
+APP_URL = "http://localhost:5173"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def browser() -> Iterator[None]:
+    """Open the Playwright browser once for the whole session.
+
+    Tests navigate to the app at their start to reset page state instead of
+    cold-starting a new browser each time.
+    """
+    playwright_navigate(APP_URL)
+    yield
+    playwright_close()
@@ -22,7 +22,8 @@ from fixtures.helpers import (
     playwright_close,
     verify_product_displayed,
     verify_no_console_errors,
-    verify_api_called,
+    collect_console_errors,
+    verify_api_called_fast,
     find_element_ref,
 )
 
@@ -86,7 +87,7 @@ def test_barcode_scan_nutella():
 
         # Verify OpenFoodFacts API was called
         network_requests = playwright_network_requests()
-        assert verify_api_called(network_requests, "openfoodfacts"), \
+        assert verify_api_called_fast(network_requests, "openfoodfacts"), \
             "OpenFoodFacts API was not called"
 
         print("  ✅ Test passed!")
@@ -96,8 +97,6 @@ def test_barcode_scan_nutella():
         print(f"  ❌ Test failed: {e}")
         playwright_screenshot(f"{SCREENSHOTS_DIR}/nutella-scan-failure.png")
         raise
-    finally:
-        playwright_close()
 
 
 def test_barcode_scan_multiple_products():
@@ -146,8 +145,6 @@ def test_barcode_scan_multiple_products():
         print(f"  ❌ Test failed: {e}")
         playwright_screenshot(f"{SCREENSHOTS_DIR}/multiple-scan-failure.png")
         raise
-    finally:
-        playwright_close()
 
 
 def test_barcode_not_found():
@@ -174,7 +171,7 @@ def test_barcode_not_found():
 
         # Verify error message is displayed
         snapshot = playwright_snapshot()
-        content = snapshot.get("content", "").lower()
+        content = snapshot.content_lower
         assert "not found" in content or "unknown" in content, \
             "Error message not displayed for unknown barcode"
 
@@ -185,8 +182,8 @@ def test_barcode_not_found():
         console_messages = playwright_console_messages()
         # Filter out expected 404 messages
         error_messages = [
-            msg for msg in console_messages
-            if msg.get("type") == "error" and "404" not in str(msg)
+            msg for msg in collect_console_errors(console_messages)
+            if "404" not in str(msg)
         ]
         assert len(error_messages) == 0, \
             f"Unexpected console errors: {error_messages}"
@@ -198,8 +195,6 @@ def test_barcode_not_found():
         print(f"  ❌ Test failed: {e}")
         playwright_screenshot(f"{SCREENSHOTS_DIR}/not-found-failure.png")
         raise
-    finally:
-        playwright_close()
 
 
 def test_barcode_manual_entry_fallback():
@@ -231,7 +226,7 @@ def test_barcode_manual_entry_fallback():
 
         # Verify form is displayed
         snapshot = playwright_snapshot()
-        content = snapshot.get("content", "").lower()
+        content = snapshot.content_lower
         assert "product name" in content or "food name" in content, \
             "Manual entry form not displayed"
 
@@ -245,8 +240,6 @@ def test_barcode_manual_entry_fallback():
         print(f"  ❌ Test failed: {e}")
         playwright_screenshot(f"{SCREENSHOTS_DIR}/manual-entry-failure.png")
         raise
-    finally:
-        playwright_close()
 
 
 def test_barcode_scan_performance():
@@ -291,8 +284,6 @@ def test_barcode_scan_performance():
     except Exception as e:
         print(f"  ❌ Test failed: {e}")
         raise
-    finally:
-        playwright_close()
 
 
 # ============================================================================
@@ -316,15 +307,19 @@ def run_all_tests():
     passed = 0
     failed = 0
 
-    for test_func in tests:
-        try:
-            test_func()
-            passed += 1
-        except Exception as e:
-            print(f"❌ {test_func.__name__} failed: {e}")
-            failed += 1
-
-        print()  # Blank line between tests
+    # One browser for the whole run; each test navigates to reset state
+    try:
+        for test_func in tests:
+            try:
+                test_func()
+                passed += 1
+            except Exception as e:
+                print(f"❌ {test_func.__name__} failed: {e}")
+                failed += 1
+
+            print()  # Blank line between tests
+    finally:
+        playwright_close()
 
     print("="*60)
     print(f"Results: {passed} passed, {failed} failed")
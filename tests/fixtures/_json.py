@@ -0,0 +1,25 @@
+"""JSON encoding for MCP payloads, using orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def loads(data: str | bytes) -> Any:
+        """Parse a JSON document."""
+        return orjson.loads(data)
+
+except ImportError:  # optional: faster JSON, falls back to stdlib
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    def loads(data: str | bytes) -> Any:
+        """Parse a JSON document."""
+        return json.loads(data)
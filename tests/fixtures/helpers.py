@@ -3,15 +3,158 @@
 Provides wrapper functions for Playwright MCP and Claude-in-Chrome tools.
 """
 
-import json
+import atexit
+import os
+import re
+import selectors
 import subprocess
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import IO, Any
+
+from fixtures._json import dumps as _dumps, loads as _loads
 
 
 # ============================================================================
 # MCP Command Execution
 # ============================================================================
 
+class _MCPClient:
+    """Long-lived mcp-cli process speaking newline-delimited JSON-RPC on stdio.
+
+    Spawning ``mcp-cli call`` per action costs a process start each time; one
+    session is started on first use and shared by every helper call.
+    """
+
+    command = ["mcp-cli", "--stdio"]
+    # Max seconds to wait for a reply before giving up on the request
+    timeout = 120.0
+
+    def __init__(self) -> None:
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._buffer = b""
+        self._lock = threading.Lock()
+        self._next_id = 0
+        # False once the session proved unusable; mcp_call then uses one-shot calls
+        self.available = True
+
+    def request(self, server_tool: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Send one tool call and wait for its response.
+
+        Raises:
+            subprocess.CalledProcessError: If the tool returns an error
+            ConnectionError: If the mcp-cli session exits mid-request or
+                does not reply within timeout
+        """
+        with self._lock:
+            proc = self._proc
+            fresh = proc is None or proc.poll() is not None
+            if fresh or proc is None:
+                proc = self._proc = subprocess.Popen(
+                    self.command,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    bufsize=0,
+                )
+                self._buffer = b""
+            assert proc.stdin is not None and proc.stdout is not None
+
+            self._next_id += 1
+            message = {
+                "jsonrpc": "2.0",
+                "id": self._next_id,
+                "method": "call",
+                "params": {"tool": server_tool, "arguments": params},
+            }
+            try:
+                proc.stdin.write(_dumps(message).encode() + b"\n")
+                response = self._read_response(proc.stdout, self._next_id)
+            except BrokenPipeError:
+                response = None
+            except ConnectionError:
+                # Hung session: kill it so the next call starts a new one
+                self._stop(proc)
+                if fresh:
+                    # Never answered anything: treat stdio mode as unsupported
+                    self.available = False
+                raise
+
+            if response is None:
+                self._stop(proc)
+                if fresh:
+                    # Died before answering anything: no stdio mode available
+                    self.available = False
+                raise ConnectionError("mcp-cli session closed")
+
+        if "error" in response:
+            raise subprocess.CalledProcessError(
+                1, ["mcp-cli", "call", server_tool], output=_dumps(response["error"])
+            )
+        result: dict[str, Any] = response["result"]
+        return result
+
+    def _read_response(self, stdout: IO[bytes], request_id: int) -> dict[str, Any] | None:
+        """Read lines until the response to request_id, or None at EOF.
+
+        The session is shared for the whole run, so notifications, log
+        output and late replies to earlier requests are skipped.
+
+        Raises:
+            ConnectionError: If no matching reply arrives within timeout
+        """
+        deadline = time.monotonic() + self.timeout
+        with selectors.DefaultSelector() as selector:
+            selector.register(stdout, selectors.EVENT_READ)
+            while True:
+                while b"\n" not in self._buffer:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise ConnectionError(
+                            f"mcp-cli did not reply within {self.timeout:g}s"
+                        )
+                    if not selector.select(remaining):
+                        continue
+                    chunk = os.read(stdout.fileno(), 65536)
+                    if not chunk:
+                        return None
+                    self._buffer += chunk
+
+                line, _, self._buffer = self._buffer.partition(b"\n")
+                try:
+                    response = _loads(line)
+                except ValueError:
+                    continue
+                if isinstance(response, dict) and response.get("id") == request_id:
+                    return response
+
+    def _stop(self, proc: subprocess.Popen[bytes]) -> None:
+        """Terminate proc (killing it if it ignores SIGTERM) and forget it."""
+        if proc.poll() is None:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        if self._proc is proc:
+            self._proc = None
+
+    def close(self) -> None:
+        """Terminate the mcp-cli process if running."""
+        with self._lock:
+            if self._proc is not None:
+                self._stop(self._proc)
+
+
+_client = _MCPClient()
+atexit.register(_client.close)
+
+
 def mcp_call(server_tool: str, params: dict[str, Any]) -> dict[str, Any]:
     """Execute MCP command and return parsed result.
 
@@ -24,28 +167,61 @@ def mcp_call(server_tool: str, params: dict[str, Any]) -> dict[str, Any]:
 
     Raises:
         subprocess.CalledProcessError: If MCP command fails
+        ConnectionError: If an established mcp-cli session dies or stops
+            replying mid-call (the next call starts a new session)
     """
+    if _client.available:
+        try:
+            return _client.request(server_tool, params)
+        except ConnectionError:
+            if _client.available:
+                raise
+
     result = subprocess.run(
-        ["mcp-cli", "call", server_tool, json.dumps(params)],
+        ["mcp-cli", "call", server_tool, _dumps(params)],
         capture_output=True,
         text=True,
         check=True
     )
-    return json.loads(result.stdout)
+    return _loads(result.stdout)
 
 
 # ============================================================================
 # Playwright MCP Helpers
 # ============================================================================
 
+class CachedSnapshot(dict[str, Any]):
+    """Page snapshot that memoizes its derived views.
+
+    Behaves as the raw snapshot dict. Lowercased content and element
+    indexes are computed on first use and reused by the verification
+    helpers; they depend only on the snapshot's own data, so they stay
+    valid after the page changes.
+    """
+
+    @cached_property
+    def content_lower(self) -> str:
+        content: str = self.get("content", "")
+        return content.lower()
+
+    @cached_property
+    def element_index(self) -> dict[str, str]:
+        return build_element_index(self)
+
+    @cached_property
+    def refs_by_id(self) -> dict[str, str | None]:
+        # Memo for find_element_ref, seeded with the exact id/ref matches
+        return dict(self.element_index)
+
+
 def playwright_navigate(url: str) -> dict[str, Any]:
     """Navigate Playwright browser to URL."""
     return mcp_call("plugin_playwright_playwright/browser_navigate", {"url": url})
 
 
-def playwright_snapshot() -> dict[str, Any]:
+def playwright_snapshot() -> CachedSnapshot:
     """Get current page snapshot with interactive elements."""
-    return mcp_call("plugin_playwright_playwright/browser_snapshot", {})
+    return CachedSnapshot(mcp_call("plugin_playwright_playwright/browser_snapshot", {}))
 
 
 def playwright_click(element: str, ref: str) -> dict[str, Any]:
@@ -124,6 +300,7 @@ def playwright_close() -> dict[str, Any]:
 # Claude-in-Chrome Helpers
 # ============================================================================
 
+
 def chrome_get_tabs() -> dict[str, Any]:
     """Get information about current Chrome tabs."""
     return mcp_call("claude-in-chrome/tabs_context_mcp", {})
@@ -199,9 +376,47 @@ def chrome_create_gif(tab_id: int, filename: str) -> dict[str, Any]:
 # Test Verification Helpers
 # ============================================================================
 
+@dataclass(frozen=True, slots=True)
+class SnapshotIndex:
+    """Snapshot content preprocessed once for repeated checks."""
+    content: str
+    content_lower: str
+
+
+def prepare_snapshot_index(snapshot: dict[str, Any]) -> SnapshotIndex:
+    """Lowercase snapshot content once, for checking many products against it.
+
+    Args:
+        snapshot: Page snapshot from playwright_snapshot()
+    """
+    content = snapshot.get("content", "")
+    if isinstance(snapshot, CachedSnapshot):
+        return SnapshotIndex(content=content, content_lower=snapshot.content_lower)
+    return SnapshotIndex(content=content, content_lower=content.lower())
+
+
+def verify_product_in_index(index: SnapshotIndex, product_name: str, calories: float) -> bool:
+    """Verify product is displayed, using a prepared snapshot index.
+
+    Args:
+        index: Result of prepare_snapshot_index()
+        product_name: Expected product name
+        calories: Expected calorie value
+
+    Returns:
+        True if product data is displayed correctly
+    """
+    name_found = product_name.lower() in index.content_lower
+    calories_found = str(int(calories)) in index.content
+    return name_found and calories_found
+
+
 def verify_product_displayed(snapshot: dict[str, Any], product_name: str, calories: float) -> bool:
     """Verify product is displayed with correct data.
 
+    For several products on one snapshot, build prepare_snapshot_index() once
+    and call verify_product_in_index() instead.
+
     Args:
         snapshot: Page snapshot from playwright_snapshot()
         product_name: Expected product name
@@ -210,10 +425,36 @@ def verify_product_displayed(snapshot: dict[str, Any], product_name: str, calori
     Returns:
         True if product data is displayed correctly
     """
-    content = snapshot.get("content", "")
-    name_found = product_name.lower() in content.lower()
-    calories_found = str(int(calories)) in content
-    return name_found and calories_found
+    return verify_product_in_index(prepare_snapshot_index(snapshot), product_name, calories)
+
+
+def verify_products_displayed(
+    snapshot: dict[str, Any], products: list[dict[str, Any]]
+) -> dict[str, bool]:
+    """Verify several products are displayed, sweeping the content once.
+
+    Args:
+        snapshot: Page snapshot from playwright_snapshot()
+        products: Product dicts with "name" and "calories" (e.g. KNOWN_BARCODES values)
+
+    Returns:
+        Mapping of each product name to whether its name and calories are shown
+    """
+    if not products:
+        return {}
+
+    index = prepare_snapshot_index(snapshot)
+    names = tuple(dict.fromkeys(p["name"].lower() for p in products))
+    union = _union_pattern(names)
+    hits = {names[_matched_index(m)] for m in union.finditer(index.content_lower)}
+
+    results = {}
+    for product in products:
+        name = product["name"].lower()
+        # Overlapping names can hide one another in a single pass; recheck misses
+        name_found = name in hits or name in index.content_lower
+        results[product["name"]] = name_found and str(int(product["calories"])) in index.content
+    return results
 
 
 def verify_no_console_errors(messages: list[dict[str, Any]]) -> bool:
@@ -225,8 +466,19 @@ def verify_no_console_errors(messages: list[dict[str, Any]]) -> bool:
     Returns:
         True if no error messages found
     """
-    errors = [msg for msg in messages if msg.get("type") == "error"]
-    return len(errors) == 0
+    return not any(msg.get("type") == "error" for msg in messages)
+
+
+def collect_console_errors(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return the error messages from a console log.
+
+    Args:
+        messages: Console messages from playwright_console_messages()
+
+    Returns:
+        Messages whose type is "error", in log order
+    """
+    return [msg for msg in messages if msg.get("type") == "error"]
 
 
 def verify_api_called(requests: list[dict[str, Any]], api_url_pattern: str) -> bool:
@@ -242,9 +494,130 @@ def verify_api_called(requests: list[dict[str, Any]], api_url_pattern: str) -> b
     return any(api_url_pattern in req.get("url", "") for req in requests)
 
 
+# URL substrings the tests check on most runs, compiled once at import
+KNOWN_API_PATTERNS: dict[str, str] = {
+    "openfoodfacts": "openfoodfacts",
+    "app": "localhost:5173",
+}
+HOT_URL_MATCHERS: dict[str, re.Pattern[str]] = {
+    name: re.compile(re.escape(pattern)) for name, pattern in KNOWN_API_PATTERNS.items()
+}
+
+
+def verify_api_called_fast(requests: list[dict[str, Any]], name: str) -> bool:
+    """Verify a well-known API was called, using its precompiled matcher.
+
+    Use verify_api_called() for ad-hoc patterns.
+
+    Args:
+        requests: Network requests from playwright_network_requests()
+        name: Key of KNOWN_API_PATTERNS (e.g., "openfoodfacts")
+
+    Returns:
+        True if API was called
+
+    Raises:
+        KeyError: If name is not in KNOWN_API_PATTERNS
+    """
+    search = HOT_URL_MATCHERS[name].search
+    return any(search(req.get("url", "")) for req in requests)
+
+
+@lru_cache(maxsize=32)
+def _union_pattern(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile literal patterns into one alternation, group pN per pattern."""
+    return re.compile("|".join(f"(?P<p{i}>{re.escape(p)})" for i, p in enumerate(patterns)))
+
+
+def _matched_index(match: re.Match[str]) -> int:
+    """Return which pattern of a _union_pattern() alternation matched."""
+    # Each pattern is exactly one group, numbered from 1 in pattern order
+    assert match.lastindex is not None
+    return match.lastindex - 1
+
+
+def verify_api_calls(requests: list[dict[str, Any]], patterns: list[str]) -> dict[str, bool]:
+    """Verify several APIs were called, scanning each request URL once.
+
+    Args:
+        requests: Network requests from playwright_network_requests()
+        patterns: Substrings to match (e.g., ["openfoodfacts.org", "/api/log"])
+
+    Returns:
+        Mapping of each pattern to whether any request URL contains it
+    """
+    if not patterns:
+        return {}
+
+    # A single regex pass per URL instead of len(patterns) substring scans
+    union = _union_pattern(tuple(patterns))
+    found: set[int] = set()
+    for req in requests:
+        for match in union.finditer(req.get("url", "")):
+            found.add(_matched_index(match))
+        if len(found) == len(patterns):
+            break
+
+    results = {p: i in found for i, p in enumerate(patterns)}
+    # Overlapping patterns can hide one another in a single pass; recheck misses
+    for pattern, hit in results.items():
+        if not hit:
+            results[pattern] = verify_api_called(requests, pattern)
+    return results
+
+
+def build_element_index(snapshot: dict[str, Any]) -> dict[str, str]:
+    """Map every element id and ref to its ref in one pass over the snapshot.
+
+    Args:
+        snapshot: Page snapshot from playwright_snapshot()
+
+    Returns:
+        Dict for O(1) exact lookups; the first element wins on duplicates
+    """
+    index: dict[str, str] = {}
+    for elem in snapshot.get("elements", []):
+        ref = elem.get("ref")
+        if not ref:
+            continue
+        for key in (elem.get("id"), ref):
+            if key and key not in index:
+                index[key] = ref
+    return index
+
+
+# Per-snapshot memo of find_element_ref results, keyed by id(snapshot) and
+# seeded with build_element_index(). Entries keep the snapshot alive so its
+# id cannot be reused while cached.
+_SNAPSHOT_CACHE_SIZE = 32
+_snapshot_ref_cache: OrderedDict[int, tuple[dict[str, Any], dict[str, str | None]]] = OrderedDict()
+
+
+def _snapshot_refs(snapshot: dict[str, Any]) -> dict[str, str | None]:
+    """Return the lookup memo for a snapshot, evicting the oldest if full."""
+    if isinstance(snapshot, CachedSnapshot):
+        return snapshot.refs_by_id
+
+    key = id(snapshot)
+    entry = _snapshot_ref_cache.get(key)
+    if entry is None or entry[0] is not snapshot:
+        # Widen to the memo type: misses are stored as None
+        refs: dict[str, str | None] = dict(build_element_index(snapshot))
+        entry = (snapshot, refs)
+        _snapshot_ref_cache[key] = entry
+        if len(_snapshot_ref_cache) > _SNAPSHOT_CACHE_SIZE:
+            _snapshot_ref_cache.popitem(last=False)
+    else:
+        _snapshot_ref_cache.move_to_end(key)
+    return entry[1]
+
+
 def find_element_ref(snapshot: dict[str, Any], element_id: str) -> str | None:
     """Extract element ref from snapshot.
 
+    Exact id/ref matches come from a per-snapshot index built once; other
+    identifiers fall back to a substring scan whose result is memoized.
+
     Args:
         snapshot: Page snapshot from playwright_snapshot()
         element_id: Element identifier to search for
@@ -252,32 +625,62 @@ def find_element_ref(snapshot: dict[str, Any], element_id: str) -> str | None:
     Returns:
         Element ref string or None if not found
     """
+    refs = _snapshot_refs(snapshot)
+    if element_id in refs:
+        return refs[element_id]
+
     # Implementation depends on snapshot structure
     # This is a placeholder - adjust based on actual snapshot format
+    ref = None
     elements = snapshot.get("elements", [])
     for elem in elements:
         if element_id in elem.get("id", "") or element_id in elem.get("ref", ""):
-            return elem.get("ref")
-    return None
+            ref = elem.get("ref")
+            break
+
+    refs[element_id] = ref
+    return ref
 
 
-def wait_for_api_call(url_pattern: str, timeout_seconds: int = 10) -> bool:
+def wait_for_api_call(
+    url_pattern: str,
+    timeout_seconds: float = 10,
+    *,
+    poll_min: float = 0.05,
+    poll_max: float = 0.5,
+    initial_requests: list[dict[str, Any]] | None = None,
+) -> bool:
     """Poll network requests until API call is detected.
 
+    Polls start fast and back off exponentially, so quick calls are seen
+    within ~poll_min while long waits don't flood MCP with requests.
+
     Args:
         url_pattern: Pattern to match in request URL
         timeout_seconds: Max time to wait
+        poll_min: First delay between polls, in seconds
+        poll_max: Cap on the delay between polls, in seconds
+        initial_requests: Requests captured before the action under test;
+            these are ignored so only calls made afterwards count
 
     Returns:
         True if API call detected within timeout
     """
-    import time
-    start_time = time.time()
+    # Requests before this index were already checked (or are pre-existing)
+    seen = len(initial_requests) if initial_requests else 0
+    deadline = time.monotonic() + timeout_seconds
+    delay = poll_min
 
-    while time.time() - start_time < timeout_seconds:
+    while True:
         requests = playwright_network_requests()
-        if verify_api_called(requests, url_pattern):
+        if len(requests) < seen:
+            seen = 0  # log was reset (e.g. by navigation); rescan from the start
+        if verify_api_called(requests[seen:], url_pattern):
             return True
-        time.sleep(0.5)
+        seen = len(requests)
 
-    return False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, poll_max)
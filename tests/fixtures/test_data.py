@@ -3,7 +3,9 @@
 Contains known-good barcodes, test users, and expected nutritional data.
 """
 
-from typing import TypedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, TypedDict
 
 
 class NutritionalData(TypedDict):
@@ -35,9 +37,25 @@ class TestUser(TypedDict):
     goals: UserGoals
 
 
+class FoodLogEntry(TypedDict):
+    """Food log entry as submitted by the app."""
+    barcode: str
+    meal_type: str  # 'breakfast', 'lunch', 'dinner', 'snack'
+    quantity: float
+    unit: str
+
+
+def _freeze(table: dict[str, Any]) -> Any:
+    """Read-only view of a fixture table, with nested dicts frozen as well."""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in table.items()
+    })
+
+
 # Known-good barcodes from OpenFoodFacts
 # These have been verified to return complete data
-KNOWN_BARCODES: dict[str, NutritionalData] = {
+KNOWN_BARCODES: Mapping[str, NutritionalData] = _freeze({
     "nutella": {
         "barcode": "3017620422003",
         "name": "Nutella",
@@ -86,11 +104,16 @@ KNOWN_BARCODES: dict[str, NutritionalData] = {
         "sodium": 0.58,
         "quality": "complete"
     }
-}
+})
+
+# Reverse index, so lookups by barcode are a single dict access
+BARCODE_TO_ENTRY: Mapping[str, NutritionalData] = MappingProxyType(
+    {entry["barcode"]: entry for entry in KNOWN_BARCODES.values()}
+)
 
 
 # Test user accounts
-TEST_USERS: dict[str, TestUser] = {
+TEST_USERS: Mapping[str, TestUser] = _freeze({
     "default": {
         "email": "test@nomnom.app",
         "password": "Test123!",
@@ -121,20 +144,20 @@ TEST_USERS: dict[str, TestUser] = {
             "fat": 140
         }
     }
-}
+})
 
 
 # Invalid/edge case barcodes for testing error handling
-INVALID_BARCODES = {
+INVALID_BARCODES: Mapping[str, str] = _freeze({
     "not_found": "0000000000000",  # Doesn't exist in OpenFoodFacts
     "too_short": "123",  # Invalid format
     "too_long": "12345678901234567890",  # Invalid format
     "non_numeric": "ABC123XYZ",  # Invalid characters
-}
+})
 
 
 # Sample food log entries for testing
-SAMPLE_FOOD_LOG = [
+SAMPLE_FOOD_LOG: tuple[FoodLogEntry, ...] = tuple(_freeze(entry) for entry in (
     {
         "barcode": "737628064502",  # Cheerios
         "meal_type": "breakfast",
@@ -158,8 +181,16 @@ SAMPLE_FOOD_LOG = [
         "meal_type": "snack",
         "quantity": 15,
         "unit": "g"
-    }
-]
+    },
+))
+
+# Column views of SAMPLE_FOOD_LOG (which stays the source of truth), for
+# bulk checks such as SAMPLE_LOG_BARCODE_SET <= logged_barcodes
+SAMPLE_LOG_BARCODES: tuple[str, ...] = tuple(e["barcode"] for e in SAMPLE_FOOD_LOG)
+SAMPLE_LOG_MEAL_TYPES: tuple[str, ...] = tuple(e["meal_type"] for e in SAMPLE_FOOD_LOG)
+SAMPLE_LOG_QUANTITIES: tuple[float, ...] = tuple(e["quantity"] for e in SAMPLE_FOOD_LOG)
+SAMPLE_LOG_UNITS: tuple[str, ...] = tuple(e["unit"] for e in SAMPLE_FOOD_LOG)
+SAMPLE_LOG_BARCODE_SET: frozenset[str] = frozenset(SAMPLE_LOG_BARCODES)
 
 
 def get_barcode(product_key: str) -> str:
@@ -172,6 +203,11 @@ def get_expected_calories(product_key: str) -> float:
     return KNOWN_BARCODES[product_key]["calories"]
 
 
+def get_product_by_barcode(barcode: str) -> NutritionalData | None:
+    """Get expected data for a known product by its barcode."""
+    return BARCODE_TO_ENTRY.get(barcode)
+
+
 def get_test_user(user_key: str = "default") -> TestUser:
     """Get test user credentials and goals."""
     return TEST_USERS[user_key]
@@ -9,10 +9,32 @@ Run this script to:
 5. Run a simple smoke test
 """
 
+import asyncio
+import json
+import os
+import re
+import shlex
 import subprocess
 import sys
-import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, partial
 from pathlib import Path
+from typing import Any, NamedTuple
+
+try:
+    from mcp import ClientSession, StdioServerParameters  # type: ignore[import-not-found, unused-ignore]
+    from mcp.client.stdio import stdio_client  # type: ignore[import-not-found, unused-ignore]
+    HAS_MCP_SDK = True
+except ImportError:  # optional: async in-process MCP client, falls back to mcp-cli
+    HAS_MCP_SDK = False
+
+# Payloads here are tiny, so stdlib json is enough; importing fixtures._json
+# would need tests/ on sys.path before verify_test_fixtures sets it up
+_dumps = partial(json.dumps, separators=(",", ":"))
+_loads = json.loads
 
 
 # Colors for terminal output
@@ -22,47 +44,238 @@ RED = "\033[91m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
+# Seconds the smoke test may take before it is cancelled
+SMOKE_TEST_TIMEOUT = 10
+# Seconds the smoke test waits for browser_close before giving up on it
+BROWSER_CLOSE_TIMEOUT = 2
+# Seconds allowed for listing MCP tools and for installing browsers
+TOOLS_TIMEOUT = 30
+INSTALL_TIMEOUT = 600
+
+# Command that starts the same Playwright MCP server mcp-cli is configured
+# with (e.g. "npx @playwright/mcp@0.0.41"). When set and the mcp package is
+# installed, the smoke test talks to that server directly; otherwise it goes
+# through mcp-cli.
+PLAYWRIGHT_MCP_COMMAND = os.environ.get("NOMNOM_PLAYWRIGHT_MCP_COMMAND", "")
+
+# Checks running on worker threads buffer their lines so each check's
+# output is printed as one block instead of interleaving with the others
+_print_lock = threading.Lock()
+_buffer = threading.local()
+
+
+def _emit(text: str) -> None:
+    """Print a line, or buffer it if the current thread is collecting output."""
+    lines = getattr(_buffer, "lines", None)
+    if lines is not None:
+        lines.append(text)
+    else:
+        with _print_lock:
+            print(text)
+
 
 def print_step(msg: str):
     """Print step message."""
-    print(f"\n{BOLD}→ {msg}{RESET}")
+    _emit(f"\n{BOLD}→ {msg}{RESET}")
 
 
 def print_success(msg: str):
     """Print success message."""
-    print(f"  {GREEN}✓ {msg}{RESET}")
+    _emit(f"  {GREEN}✓ {msg}{RESET}")
 
 
 def print_warning(msg: str):
     """Print warning message."""
-    print(f"  {YELLOW}⚠ {msg}{RESET}")
+    _emit(f"  {YELLOW}⚠ {msg}{RESET}")
 
 
 def print_error(msg: str):
     """Print error message."""
-    print(f"  {RED}✗ {msg}{RESET}")
+    _emit(f"  {RED}✗ {msg}{RESET}")
 
 
-def run_command(cmd: list[str], capture: bool = True) -> tuple[bool, str]:
-    """Run command and return (success, output)."""
+class CmdResult(NamedTuple):
+    """Outcome of run_command."""
+    ok: bool
+    out: str
+    err: str = ""
+
+
+def run_command(cmd: list[str], capture: bool = True, discard: bool = False) -> CmdResult:
+    """Run command and return its CmdResult.
+
+    stderr is captured alongside stdout, so failures can be reported
+    without running the command again. With discard=True, both go to
+    /dev/null and only ok is meaningful.
+    """
     try:
+        if discard:
+            returncode = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
+            ).returncode
+            return CmdResult(returncode == 0, "")
         result = subprocess.run(
             cmd,
             capture_output=capture,
             text=True,
             check=False
         )
-        return result.returncode == 0, result.stdout
+        return CmdResult(result.returncode == 0, result.stdout or "", result.stderr or "")
     except Exception as e:
-        return False, str(e)
+        return CmdResult(False, "", str(e))
+
+
+def _mcp_oneshot(method: str, params: dict[str, Any], timeout: float | None) -> dict[str, Any]:
+    """Run one MCP request as its own `mcp-cli` process (no stdio session)."""
+    if method == "tools":
+        cmd = ["mcp-cli", "tools"]
+    else:
+        cmd = ["mcp-cli", "call", params["tool"], _dumps(params.get("arguments", {}))]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=False)
+    except subprocess.TimeoutExpired:
+        return {"error": f"timed out after {timeout:g}s"}
+    if result.returncode == 0:
+        return {"result": result.stdout}
+    return {"error": result.stderr or result.stdout}
+
+
+# Whether `mcp-cli --stdio` answers requests; None until a batch has tried it
+_stdio_supported: bool | None = None
+
+
+def mcp_batch(
+    calls: list[tuple[str, dict[str, Any]]], timeout: float | None = None
+) -> list[dict[str, Any]]:
+    """Send several MCP requests through a single `mcp-cli` session.
+
+    All requests are written as newline-delimited JSON-RPC to one
+    `mcp-cli --stdio` process, so the batch pays one spawn and handshake
+    instead of one per request. Calls the session did not answer are
+    retried as one-shot commands, each given an equal share of the time
+    left, so a call that times out does not stop the ones after it (such
+    as a closing browser_close). Once the stdio session has failed to
+    answer anything, later batches skip it and go straight to one-shots.
+
+    Args:
+        calls: (method, params) pairs, e.g. ("tools", {}) or
+            ("call", {"tool": "...", "arguments": {...}})
+        timeout: Max seconds for the whole batch
+
+    Returns:
+        One JSON-RPC style response per call, in order, each holding
+        either "result" or "error"
+    """
+    global _stdio_supported
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    responses: dict[int, dict[str, Any]] = {}
+    if _stdio_supported is not False:
+        payload = "".join(
+            _dumps({"jsonrpc": "2.0", "id": i, "method": method, "params": params}) + "\n"
+            for i, (method, params) in enumerate(calls)
+        )
+        # Until stdio mode has proven itself, leave half the time for one-shots
+        session_timeout = timeout if timeout is None or _stdio_supported else timeout / 2
+        try:
+            result = subprocess.run(
+                ["mcp-cli", "--stdio"],
+                input=payload,
+                capture_output=True,
+                text=True,
+                timeout=session_timeout,
+                check=False
+            )
+            for line in result.stdout.splitlines():
+                try:
+                    response = _loads(line)
+                except ValueError:
+                    continue
+                if isinstance(response, dict) and isinstance(response.get("id"), int):
+                    responses[response["id"]] = response
+        except subprocess.TimeoutExpired:
+            pass
+        except OSError as e:
+            return [{"error": str(e)} for _ in calls]
+        _stdio_supported = bool(responses)
+
+    missing = [i for i in range(len(calls)) if i not in responses]
+    for n, i in enumerate(missing):
+        share = None
+        if deadline is not None:
+            share = max(deadline - time.monotonic(), 0) / (len(missing) - n)
+        method, params = calls[i]
+        responses[i] = _mcp_oneshot(method, params, share)
+    return [responses[i] for i in range(len(calls))]
+
+
+# Response of the MCP tool listing, fetched once and shared by the tool checks
+_TOOLS_RESPONSE: dict[str, Any] | None = None
+_TOOLS_LOCK = threading.Lock()
+
+
+def _playwright_cache_dir() -> Path | None:
+    """Return where Playwright keeps downloaded browsers on this platform.
+
+    None when PLAYWRIGHT_BROWSERS_PATH=0, which stores them inside the
+    installed package instead of a shared cache.
+    """
+    override = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
+    if override == "0":
+        return None
+    if override:
+        return Path(override).expanduser()
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "ms-playwright"
+    if sys.platform == "win32":
+        return Path(os.environ.get("LOCALAPPDATA", Path.home())) / "ms-playwright"
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "ms-playwright"
+
+
+def _playwright_installed() -> bool:
+    """Return True if the Playwright browser cache holds a Chromium build."""
+    cache = _playwright_cache_dir()
+    if cache is None or not cache.is_dir():
+        return False
+    # Covers chromium-<rev> and chromium_headless_shell-<rev>; other leftovers
+    # such as ffmpeg-<rev> or .links don't count
+    return any(entry.is_dir() for entry in cache.glob("chromium*-*"))
+
+
+def _mcp_tools_response() -> dict[str, Any]:
+    """Fetch the MCP tool listing once; the tool checks share the response."""
+    global _TOOLS_RESPONSE
+    with _TOOLS_LOCK:
+        if _TOOLS_RESPONSE is None:
+            _TOOLS_RESPONSE = mcp_batch([("tools", {})], timeout=TOOLS_TIMEOUT)[0]
+    return _TOOLS_RESPONSE
+
+
+# "server/tool" identifiers, wherever they appear on a listing line
+_TOOL_NAME_RE = re.compile(r"[\w.-]+/[\w.-]+")
+
+
+@cache
+def _mcp_tool_names() -> frozenset[str] | None:
+    """Parse the MCP tool listing once into a set of names (None on failure)."""
+    response = _mcp_tools_response()
+    if "error" in response:
+        return None
+    result = response["result"]
+    if isinstance(result, list):
+        return frozenset(t.get("name", "") if isinstance(t, dict) else str(t) for t in result)
+    return frozenset(_TOOL_NAME_RE.findall(str(result)))
 
 
 def check_mcp_cli():
     """Verify mcp-cli is available."""
     print_step("Checking mcp-cli availability")
 
-    success, output = run_command(["which", "mcp-cli"])
-    if success:
+    if run_command(["which", "mcp-cli"], discard=True).ok:
         print_success("mcp-cli is installed")
         return True
     else:
@@ -75,8 +288,8 @@ def check_playwright_tools():
     """Verify Playwright MCP tools are available."""
     print_step("Checking Playwright MCP tools")
 
-    success, output = run_command(["mcp-cli", "tools"])
-    if not success:
+    tools = _mcp_tool_names()
+    if tools is None:
         print_error("Could not list MCP tools")
         return False
 
@@ -87,7 +300,7 @@ def check_playwright_tools():
     ]
 
     for tool in playwright_tools:
-        if tool in output:
+        if tool in tools:
             print_success(f"Found: {tool}")
         else:
             print_warning(f"Missing: {tool}")
@@ -99,8 +312,8 @@ def check_chrome_tools():
     """Verify Chrome extension MCP tools are available."""
     print_step("Checking Claude-in-Chrome tools")
 
-    success, output = run_command(["mcp-cli", "tools"])
-    if not success:
+    tools = _mcp_tool_names()
+    if tools is None:
         print_error("Could not list MCP tools")
         return False
 
@@ -111,7 +324,7 @@ def check_chrome_tools():
     ]
 
     for tool in chrome_tools:
-        if tool in output:
+        if tool in tools:
             print_success(f"Found: {tool}")
         else:
             print_warning(f"Missing: {tool} - Chrome extension may not be installed")
@@ -123,18 +336,20 @@ def install_playwright_browsers():
     """Install Playwright browsers if needed."""
     print_step("Installing Playwright browsers")
 
-    success, output = run_command([
-        "mcp-cli", "call",
-        "plugin_playwright_playwright/browser_install",
-        "{}"
-    ])
+    if _playwright_installed():
+        print_success("Playwright browsers already installed")
+        return True
+
+    response = mcp_batch([
+        ("call", {"tool": "plugin_playwright_playwright/browser_install", "arguments": {}}),
+    ], timeout=INSTALL_TIMEOUT)[0]
 
-    if success:
+    if "error" not in response:
         print_success("Playwright browsers installed")
         return True
     else:
         print_error("Failed to install Playwright browsers")
-        print_error(output)
+        print_error(str(response["error"]))
         return False
 
 
@@ -142,9 +357,12 @@ def verify_test_fixtures():
     """Verify test fixtures load correctly."""
     print_step("Verifying test fixtures")
 
+    tests_dir = str(Path(__file__).parent)
+    # Only touch sys.path for the first import; repeat runs reuse sys.modules
+    add_path = not {"fixtures.test_data", "fixtures.helpers"} <= sys.modules.keys()
     try:
-        # Add tests directory to path
-        sys.path.insert(0, str(Path(__file__).parent))
+        if add_path:
+            sys.path.insert(0, tests_dir)
 
         from fixtures.test_data import KNOWN_BARCODES, TEST_USERS, get_barcode
         from fixtures.helpers import mcp_call
@@ -166,6 +384,10 @@ def verify_test_fixtures():
         print_error(f"Failed to load test fixtures: {e}")
         return False
 
+    finally:
+        if add_path and tests_dir in sys.path:
+            sys.path.remove(tests_dir)
+
 
 def create_directories():
     """Create required test directories."""
@@ -188,39 +410,53 @@ def create_directories():
     return True
 
 
+async def _smoke_test_session(command: list[str]) -> bool:
+    """Navigate and close the browser over one async MCP session."""
+    server = StdioServerParameters(command=command[0], args=command[1:])
+    async with stdio_client(server) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            try:
+                result = await session.call_tool("browser_navigate", {"url": "https://example.com"})
+                return not result.isError
+            finally:
+                try:
+                    await asyncio.wait_for(
+                        session.call_tool("browser_close", {}), timeout=BROWSER_CLOSE_TIMEOUT
+                    )
+                except TimeoutError:
+                    pass  # the session is torn down on exit either way
+
+
 def run_smoke_test():
     """Run a simple smoke test with Playwright."""
     print_step("Running smoke test")
 
     try:
-        # Simple navigation test
-        result = subprocess.run(
-            [
-                "mcp-cli", "call",
-                "plugin_playwright_playwright/browser_navigate",
-                json.dumps({"url": "https://example.com"})
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode == 0:
-            print_success("Playwright navigation works")
-
-            # Close browser
-            subprocess.run(
-                ["mcp-cli", "call", "plugin_playwright_playwright/browser_close", "{}"],
-                capture_output=True,
-                timeout=10
+        server_command = shlex.split(PLAYWRIGHT_MCP_COMMAND)
+        if HAS_MCP_SDK and server_command:
+            navigated = asyncio.run(
+                asyncio.wait_for(_smoke_test_session(server_command), timeout=SMOKE_TEST_TIMEOUT)
             )
-
+        else:
+            # Navigate and close in one session; close is sent even if navigation fails
+            navigate, _ = mcp_batch([
+                ("call", {
+                    "tool": "plugin_playwright_playwright/browser_navigate",
+                    "arguments": {"url": "https://example.com"},
+                }),
+                ("call", {"tool": "plugin_playwright_playwright/browser_close", "arguments": {}}),
+            ], timeout=SMOKE_TEST_TIMEOUT)
+            navigated = "error" not in navigate
+
+        if navigated:
+            print_success("Playwright navigation works")
             return True
         else:
             print_warning("Playwright navigation failed (may need first-time setup)")
             return False
 
-    except subprocess.TimeoutExpired:
+    except (subprocess.TimeoutExpired, TimeoutError):
         print_warning("Smoke test timed out (browser may be initializing)")
         return False
     except Exception as e:
@@ -228,6 +464,15 @@ def run_smoke_test():
         return False
 
 
+def _run_buffered(check: Callable[[], bool]) -> tuple[bool, list[str]]:
+    """Run a check on a worker thread, returning its result and output lines."""
+    _buffer.lines = []
+    try:
+        return check(), _buffer.lines
+    finally:
+        del _buffer.lines
+
+
 def print_summary(results: dict[str, bool]):
     """Print summary of all checks."""
     print("\n" + "="*60)
@@ -255,15 +500,32 @@ def main():
     print("NomNom Testing Environment Setup")
     print(f"{'='*60}{RESET}\n")
 
-    results = {}
-
-    # Run checks
-    results["MCP CLI Available"] = check_mcp_cli()
-    results["Playwright Tools Available"] = check_playwright_tools()
-    results["Chrome Tools Available"] = check_chrome_tools()
-    results["Playwright Browsers Installed"] = install_playwright_browsers()
-    results["Test Fixtures Load"] = verify_test_fixtures()
-    results["Directories Created"] = create_directories()
+    # Independent checks run concurrently; output is printed in this order
+    independent = {
+        "MCP CLI Available": check_mcp_cli,
+        "Playwright Tools Available": check_playwright_tools,
+        "Chrome Tools Available": check_chrome_tools,
+        "Test Fixtures Load": verify_test_fixtures,
+        "Directories Created": create_directories,
+    }
+    checked = {}
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = {name: ex.submit(_run_buffered, check) for name, check in independent.items()}
+        for name, future in futures.items():
+            passed, lines = future.result()
+            for line in lines:
+                _emit(line)
+            checked[name] = passed
+
+    results = {
+        "MCP CLI Available": checked["MCP CLI Available"],
+        "Playwright Tools Available": checked["Playwright Tools Available"],
+        "Chrome Tools Available": checked["Chrome Tools Available"],
+        # Install and smoke test depend on the checks above, so run after them
+        "Playwright Browsers Installed": install_playwright_browsers(),
+        "Test Fixtures Load": checked["Test Fixtures Load"],
+        "Directories Created": checked["Directories Created"],
+    }
     results["Smoke Test Passed"] = run_smoke_test()
 
     # Print summary
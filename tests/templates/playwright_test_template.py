@@ -24,6 +24,7 @@ from fixtures.helpers import (
     verify_product_displayed,
     verify_no_console_errors,
     find_element_ref,
+    prepare_snapshot_index,
 )
 
 
@@ -77,9 +78,10 @@ def test_example_feature():
         playwright_wait_for("visible", "div[result]", timeout=5000)
 
         # Step 6: Verify result
+        # Build the index once per snapshot and reuse it for every check
         snapshot = playwright_snapshot()
-        content = snapshot.get("content", "")
-        assert "expected text" in content.lower(), \
+        index = prepare_snapshot_index(snapshot)
+        assert "expected text" in index.content_lower, \
             "Expected result not found in page content"
 
         # Step 7: Take screenshot
@@ -102,9 +104,6 @@ def test_example_feature():
         playwright_screenshot(f"{SCREENSHOTS_DIR}/test-example-failure.png")
         raise
 
-    finally:
-        playwright_close()
-
 
 # ============================================================================
 # Test Runner
@@ -124,15 +123,19 @@ def run_all_tests():
     passed = 0
     failed = 0
 
-    for test_func in tests:
-        try:
-            test_func()
-            passed += 1
-        except Exception as e:
-            print(f"❌ {test_func.__name__} failed: {e}")
-            failed += 1
-
-        print()  # Blank line between tests
+    # One browser for the whole run; each test navigates to reset state
+    try:
+        for test_func in tests:
+            try:
+                test_func()
+                passed += 1
+            except Exception as e:
+                print(f"❌ {test_func.__name__} failed: {e}")
+                failed += 1
+
+            print()  # Blank line between tests
+    finally:
+        playwright_close()
 
     print("="*60)
     print(f"Results: {passed} passed, {failed} failed")
@@ -0,0 +1,230 @@
+"""Unit tests for the browser test helpers.
+
+MCP is never contacted: network requests and the clock are monkeypatched.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fixtures import helpers
+from fixtures.helpers import (
+    CachedSnapshot,
+    find_element_ref,
+    verify_api_calls,
+    verify_products_displayed,
+    wait_for_api_call,
+)
+
+
+# ============================================================================
+# Fakes
+# ============================================================================
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep; sleeping advances the clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(helpers.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(helpers.time, "sleep", fake.sleep)
+    return fake
+
+
+def serve_requests(
+    monkeypatch: pytest.MonkeyPatch, polls: list[list[dict[str, Any]]]
+) -> list[list[dict[str, Any]]]:
+    """Make playwright_network_requests() return each poll's list in turn.
+
+    The last list is repeated once polls run out. Returns the lists that
+    were actually served.
+    """
+    served: list[list[dict[str, Any]]] = []
+
+    def fake_requests() -> list[dict[str, Any]]:
+        requests = polls[min(len(served), len(polls) - 1)]
+        served.append(requests)
+        return requests
+
+    monkeypatch.setattr(helpers, "playwright_network_requests", fake_requests)
+    return served
+
+
+def req(url: str) -> dict[str, Any]:
+    return {"url": url, "method": "GET"}
+
+
+# ============================================================================
+# find_element_ref
+# ============================================================================
+
+SNAPSHOT_ELEMENTS = [
+    {"id": "submit-button-old", "ref": "e1"},
+    {"id": "submit", "ref": "e2"},
+    {"id": "cancel", "ref": "e3"},
+]
+
+
+@pytest.mark.parametrize("make_snapshot", [dict, CachedSnapshot])
+def test_find_element_ref_exact_match_beats_earlier_substring(make_snapshot: Any) -> None:
+    """An exact id wins even when an earlier element contains it as a substring."""
+    snapshot = make_snapshot(elements=SNAPSHOT_ELEMENTS)
+
+    assert find_element_ref(snapshot, "submit") == "e2"
+    assert find_element_ref(snapshot, "e3") == "e3"
+
+
+@pytest.mark.parametrize("make_snapshot", [dict, CachedSnapshot])
+def test_find_element_ref_substring_fallback_and_miss(make_snapshot: Any) -> None:
+    """Non-exact ids fall back to the first substring match; misses are None."""
+    snapshot = make_snapshot(elements=SNAPSHOT_ELEMENTS)
+
+    assert find_element_ref(snapshot, "button") == "e1"
+    assert find_element_ref(snapshot, "missing") is None
+    # Memoized results are returned on repeat lookups
+    assert find_element_ref(snapshot, "button") == "e1"
+    assert find_element_ref(snapshot, "missing") is None
+
+
+def test_find_element_ref_does_not_reuse_other_snapshots() -> None:
+    """A new snapshot gets its own index, not a stale memo."""
+    first = {"elements": [{"id": "scan", "ref": "e1"}]}
+    second = {"elements": [{"id": "scan", "ref": "e9"}]}
+
+    assert find_element_ref(first, "scan") == "e1"
+    assert find_element_ref(second, "scan") == "e9"
+
+
+# ============================================================================
+# wait_for_api_call
+# ============================================================================
+
+def test_wait_for_api_call_backs_off_up_to_poll_max(
+    monkeypatch: pytest.MonkeyPatch, clock: FakeClock
+) -> None:
+    """Delays double from poll_min, are capped at poll_max and end at the deadline."""
+    serve_requests(monkeypatch, [[]])
+
+    assert not wait_for_api_call("openfoodfacts", timeout_seconds=2, poll_min=0.1, poll_max=0.5)
+    assert clock.sleeps[:4] == pytest.approx([0.1, 0.2, 0.4, 0.5])
+    assert all(delay <= 0.5 for delay in clock.sleeps)
+    assert sum(clock.sleeps) == pytest.approx(2)
+
+
+def test_wait_for_api_call_returns_once_request_appears(
+    monkeypatch: pytest.MonkeyPatch, clock: FakeClock
+) -> None:
+    """Returns True on the poll that first sees the call, without sleeping further."""
+    served = serve_requests(monkeypatch, [
+        [req("http://localhost:5173/")],
+        [req("http://localhost:5173/"), req("https://world.openfoodfacts.org/api/v2/product/1")],
+    ])
+
+    assert wait_for_api_call("openfoodfacts", timeout_seconds=5, poll_min=0.05)
+    assert len(served) == 2
+    assert clock.sleeps == [0.05]
+
+
+def test_wait_for_api_call_ignores_initial_requests(
+    monkeypatch: pytest.MonkeyPatch, clock: FakeClock
+) -> None:
+    """Calls already in initial_requests do not count."""
+    before = [req("https://world.openfoodfacts.org/api/v2/product/1")]
+    serve_requests(monkeypatch, [before])
+
+    assert not wait_for_api_call("openfoodfacts", timeout_seconds=1, initial_requests=before)
+
+
+def test_wait_for_api_call_scans_only_new_requests(
+    monkeypatch: pytest.MonkeyPatch, clock: FakeClock
+) -> None:
+    """Each poll checks only requests after those already seen."""
+    scanned: list[list[str]] = []
+    real_verify = helpers.verify_api_called
+
+    def spy(requests: list[dict[str, Any]], pattern: str) -> bool:
+        scanned.append([r["url"] for r in requests])
+        return real_verify(requests, pattern)
+
+    monkeypatch.setattr(helpers, "verify_api_called", spy)
+    serve_requests(monkeypatch, [
+        [req("/a")],
+        [req("/a"), req("/b")],
+        [req("/a"), req("/b"), req("/api/log")],
+    ])
+
+    assert wait_for_api_call("/api/log", timeout_seconds=5)
+    assert scanned == [["/a"], ["/b"], ["/api/log"]]
+
+
+def test_wait_for_api_call_rescans_after_log_reset(
+    monkeypatch: pytest.MonkeyPatch, clock: FakeClock
+) -> None:
+    """A shorter request list (e.g. after navigation) is scanned from the start."""
+    serve_requests(monkeypatch, [
+        [req("/a"), req("/b"), req("/c")],
+        [req("https://world.openfoodfacts.org/api/v2/product/1")],
+    ])
+
+    assert wait_for_api_call("openfoodfacts", timeout_seconds=5)
+
+
+# ============================================================================
+# Bulk verification
+# ============================================================================
+
+def test_verify_api_calls_reports_each_pattern() -> None:
+    requests = [req("https://world.openfoodfacts.org/api/v2/product/1"), req("/api/log")]
+
+    assert verify_api_calls(requests, ["openfoodfacts.org", "/api/log", "/api/goals"]) == {
+        "openfoodfacts.org": True,
+        "/api/log": True,
+        "/api/goals": False,
+    }
+    assert verify_api_calls(requests, []) == {}
+
+
+def test_verify_api_calls_finds_overlapping_patterns() -> None:
+    """Patterns hidden by an earlier, overlapping match are still found."""
+    requests = [req("https://world.openfoodfacts.org/api")]
+
+    assert verify_api_calls(requests, ["openfoodfacts.org", "foodfacts"]) == {
+        "openfoodfacts.org": True,
+        "foodfacts": True,
+    }
+
+
+def test_verify_products_displayed() -> None:
+    snapshot = CachedSnapshot(content="Nutella 539 kcal | Coca-Cola 42 kcal")
+    products = [
+        {"name": "Nutella", "calories": 539},
+        {"name": "Coca-Cola", "calories": 10},  # shown, but with other calories
+        {"name": "Cheerios", "calories": 367},
+        {"name": "Cola", "calories": 42},  # overlaps with Coca-Cola
+    ]
+
+    assert verify_products_displayed(snapshot, products) == {
+        "Nutella": True,
+        "Coca-Cola": False,
+        "Cheerios": False,
+        "Cola": True,
+    }
+    assert verify_products_displayed(snapshot, []) == {}
@@ -0,0 +1,91 @@
+"""Unit tests for the MCP batching in setup_test_environment.
+
+mcp-cli is never run: subprocess.run is monkeypatched.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import setup_test_environment as setup_env
+
+CALLS: list[tuple[str, dict[str, Any]]] = [
+    ("call", {"tool": "plugin_playwright_playwright/browser_navigate", "arguments": {}}),
+    ("call", {"tool": "plugin_playwright_playwright/browser_close", "arguments": {}}),
+]
+
+
+class FakeRun:
+    """Records subprocess.run calls; `mcp-cli --stdio` hangs until its timeout.
+
+    Time only passes while a fake process hangs, via monotonic().
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.calls: list[tuple[list[str], float | None]] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def __call__(self, cmd: list[str], *, timeout: float | None = None, **kwargs: Any) -> Any:
+        self.calls.append((cmd, timeout))
+        if cmd[1] == "--stdio":
+            self.now += timeout or 0
+            raise subprocess.TimeoutExpired(cmd, timeout or 0)
+        return subprocess.CompletedProcess(cmd, 0, stdout="{}", stderr="")
+
+
+@pytest.fixture
+def fake_run(monkeypatch: pytest.MonkeyPatch) -> FakeRun:
+    fake = FakeRun()
+    monkeypatch.setattr(setup_env.subprocess, "run", fake)
+    monkeypatch.setattr(setup_env.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(setup_env, "_stdio_supported", None)
+    return fake
+
+
+def test_mcp_batch_falls_back_to_oneshots_within_deadline(fake_run: FakeRun) -> None:
+    """A hung stdio session leaves time for every call as a one-shot."""
+    responses = setup_env.mcp_batch(CALLS, timeout=10)
+
+    assert responses == [{"result": "{}"}, {"result": "{}"}]
+    (stdio_cmd, stdio_timeout), *oneshots = fake_run.calls
+    assert stdio_cmd == ["mcp-cli", "--stdio"]
+    assert stdio_timeout == pytest.approx(5)
+    # Remaining time is split evenly between the one-shots
+    assert [cmd[2] for cmd, _ in oneshots] == [params["tool"] for _, params in CALLS]
+    assert [t for _, t in oneshots] == pytest.approx([2.5, 5])
+
+
+def test_mcp_batch_skips_stdio_after_it_fails(fake_run: FakeRun) -> None:
+    """Once stdio mode has failed, later batches go straight to one-shots."""
+    setup_env.mcp_batch(CALLS, timeout=10)
+    fake_run.calls.clear()
+
+    setup_env.mcp_batch(CALLS, timeout=10)
+
+    assert all(cmd[1] == "call" for cmd, _ in fake_run.calls)
+    assert [t for _, t in fake_run.calls] == pytest.approx([5, 10])
+
+
+def test_mcp_batch_timed_out_oneshot_becomes_error(
+    monkeypatch: pytest.MonkeyPatch, fake_run: FakeRun
+) -> None:
+    """A one-shot that times out is reported as an error, not raised."""
+    monkeypatch.setattr(setup_env, "_stdio_supported", False)
+
+    def hang(cmd: list[str], *, timeout: float | None = None, **kwargs: Any) -> Any:
+        raise subprocess.TimeoutExpired(cmd, timeout or 0)
+
+    monkeypatch.setattr(setup_env.subprocess, "run", hang)
+
+    responses = setup_env.mcp_batch(CALLS, timeout=4)
+
+    assert all("timed out" in r["error"] for r in responses)